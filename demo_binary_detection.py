@@ -2,19 +2,27 @@
 """
 Demo: Binary Feature Detection and Target Exclusion
 Run this to see how binary features and target columns are handled
+
+Pass verbose=False to main() to run the transformations without any
+stdout traffic, e.g. when timing the transform cost.
 """
+import contextlib
+import io
 import sys
 sys.path.append('/Users/chaimaesriti/piaa-codex/piaa')
 
 import numpy as np
 import pandas as pd
 from src.features.feature_engineering import FeatureEngineer
+from src.features.feature_stats import FeatureStats
+
 
+def main(verbose: bool = True):
+    vprint = print if verbose else (lambda *args, **kwargs: None)
 
-def main():
-    print("=" * 70)
-    print("DEMO: Binary Feature Detection & Target Exclusion")
-    print("=" * 70)
+    vprint("=" * 70)
+    vprint("DEMO: Binary Feature Detection & Target Exclusion")
+    vprint("=" * 70)
 
     # Create sample data
     np.random.seed(42)
@@ -40,78 +48,88 @@ def main():
         'target': np.random.choice([0, 1], n)
     })
 
-    print(f"\nSample data created: {df.shape}")
-    print("\nFirst 5 rows:")
-    print(df.head())
-
-    print("\n" + "=" * 70)
-    print("Feature Cardinalities:")
-    print("=" * 70)
-    for col in df.columns:
-        n_unique = df[col].nunique()
-        marker = " ← BINARY" if n_unique == 2 else ""
-        target_marker = " ← TARGET" if col == 'target' else ""
-        print(f"  {col:15s}: {n_unique:3d} unique values{marker}{target_marker}")
+    vprint(f"\nSample data created: {df.shape}")
+    vprint("\nFirst 5 rows:")
+    vprint(df.head())
+
+    # Compute column statistics once and reuse them everywhere below
+    stats = FeatureStats.compute(df)
+
+    vprint("\n" + "=" * 70)
+    vprint("Feature Cardinalities:")
+    vprint("=" * 70)
+    if verbose:
+        card_df = pd.DataFrame({
+            'column': df.columns,
+            'nunique': stats.nunique.reindex(df.columns).to_numpy()
+        })
+        card_df['marker'] = np.where(card_df['nunique'] == 2, '← BINARY', '')
+        card_df.loc[card_df['column'] == 'target', 'marker'] += ' ← TARGET'
+        vprint(card_df.to_string(index=False))
 
     # Transform features
-    print("\n" + "=" * 70)
-    print("Applying Transformations with target='target'")
-    print("=" * 70)
+    vprint("\n" + "=" * 70)
+    vprint("Applying Transformations with target='target'")
+    vprint("=" * 70)
 
     fe = FeatureEngineer()
 
     numerical_cols = ['age', 'salary', 'is_employed', 'has_degree', 'target']
     categorical_cols = ['city', 'gender', 'premium']
 
-    df_transformed = fe.fit_transform_numerical(df, numerical_cols, target_col='target')
-    df_transformed = fe.fit_transform_categorical(df_transformed, categorical_cols, target_col='target')
-
-    print("\n" + "=" * 70)
-    print("Results:")
-    print("=" * 70)
-    print(f"Original shape:    {df.shape}")
-    print(f"Transformed shape: {df_transformed.shape}")
-    print(f"Features added:    {df_transformed.shape[1] - df.shape[1]}")
-
-    print("\n" + "=" * 70)
-    print("What was skipped:")
-    print("=" * 70)
-    print(f"Binary features: {fe.binary_features}")
-    print(f"Target column:   {fe.target_col}")
-
-    print("\n" + "=" * 70)
-    print("What was transformed:")
-    print("=" * 70)
-    summary = fe.get_feature_summary()
-
-    # Show by type
-    for feat_type in ['binary', 'capped', 'binned', 'categorical_grouped', 'none']:
-        subset = summary[summary['transformation_type'] == feat_type]
-        if not subset.empty:
-            print(f"\n{feat_type.upper()}:")
-            for _, row in subset.iterrows():
-                if row['original_feature'] != row['transformed_feature']:
-                    print(f"  {row['original_feature']} → {row['transformed_feature']}")
-                else:
-                    print(f"  {row['original_feature']} (unchanged)")
-
-    print("\n" + "=" * 70)
-    print("New Column Names:")
-    print("=" * 70)
+    # The engineer prints its own skip notices; swallow them in the
+    # silent path so verbose=False really produces no stdout traffic
+    sink = contextlib.nullcontext() if verbose \
+        else contextlib.redirect_stdout(io.StringIO())
+    with sink:
+        df_transformed = fe.fit_transform_numerical(df, numerical_cols, target_col='target', stats=stats)
+        df_transformed = fe.fit_transform_categorical(df_transformed, categorical_cols, target_col='target', stats=stats)
+
+    vprint("\n" + "=" * 70)
+    vprint("Results:")
+    vprint("=" * 70)
+    vprint(f"Original shape:    {df.shape}")
+    vprint(f"Transformed shape: {df_transformed.shape}")
+    vprint(f"Features added:    {df_transformed.shape[1] - df.shape[1]}")
+
+    vprint("\n" + "=" * 70)
+    vprint("What was skipped:")
+    vprint("=" * 70)
+    vprint(f"Binary features: {fe.binary_features}")
+    vprint(f"Target column:   {fe.target_col}")
+
+    vprint("\n" + "=" * 70)
+    vprint("What was transformed:")
+    vprint("=" * 70)
+    if verbose:
+        summary = fe.get_feature_summary()
+
+        # Show by type (one formatted block per type, no per-row iteration)
+        for feat_type in ['binary', 'capped', 'binned', 'categorical_grouped', 'none']:
+            subset = summary[summary['transformation_type'] == feat_type]
+            if not subset.empty:
+                vprint(f"\n{feat_type.upper()}:")
+                vprint(subset[['original_feature', 'transformed_feature']].to_string(index=False))
+
+    vprint("\n" + "=" * 70)
+    vprint("New Column Names:")
+    vprint("=" * 70)
     new_cols = [col for col in df_transformed.columns if col not in df.columns]
-    print(f"\nAdded {len(new_cols)} new columns:")
+    vprint(f"\nAdded {len(new_cols)} new columns:")
     for col in new_cols:
-        print(f"  - {col}")
-
-    print("\n" + "=" * 70)
-    print("Key Takeaways:")
-    print("=" * 70)
-    print("  ✓ Binary features (2 unique values) are auto-detected")
-    print("  ✓ Binary features are kept as-is, no transformations applied")
-    print("  ✓ Target column is excluded when specified")
-    print("  ✓ Regular features get capped + binned variants")
-    print("  ✓ All transformations are tracked for reproducibility")
-    print("\n" + "=" * 70)
+        vprint(f"  - {col}")
+
+    vprint("\n" + "=" * 70)
+    vprint("Key Takeaways:")
+    vprint("=" * 70)
+    vprint("  ✓ Binary features (2 unique values) are auto-detected")
+    vprint("  ✓ Binary features are kept as-is, no transformations applied")
+    vprint("  ✓ Target column is excluded when specified")
+    vprint("  ✓ Regular features get capped + binned variants")
+    vprint("  ✓ All transformations are tracked for reproducibility")
+    vprint("\n" + "=" * 70)
+
+    return df_transformed
 
 
 if __name__ == "__main__":
@@ -0,0 +1,119 @@
+"""
+Optional Numba Kernels
+Fused percentile/clip/digitize kernel for the numeric transform hot path
+
+Numba is an optional dependency: when it is not installed,
+NUMBA_AVAILABLE is False and FeatureEngineer keeps using the
+vectorized NumPy path.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _quantile_sorted(sorted_vals, q):
+        """Linear-interpolated quantile of an ascending-sorted array"""
+        n = sorted_vals.shape[0]
+        if n == 1:
+            return sorted_vals[0]
+        pos = q * (n - 1)
+        lo_idx = int(pos)
+        if lo_idx >= n - 1:
+            return sorted_vals[n - 1]
+        frac = pos - lo_idx
+        return sorted_vals[lo_idx] + frac * (sorted_vals[lo_idx + 1] - sorted_vals[lo_idx])
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def fit_capped_binned(block, pct_lo, pct_hi, bin_counts,
+                          capped, bins, lowers, uppers, mins, maxs, valid_counts):
+        """
+        Fused fit kernel over a (n_rows, n_cols) numeric block.
+
+        For each column (in parallel): gathers valid values and min/max in
+        one pass, takes the cap percentiles from a sorted copy, then fills
+        the capped values and the bin index for every requested bin count
+        in a single second pass, so each column is read twice instead of
+        once per operation. Missing values get NaN in `capped` and the -1
+        sentinel bin. Outputs are written into the preallocated arrays:
+        capped (n_rows, n_cols), bins (n_bin_opts, n_rows, n_cols),
+        lowers/uppers/mins/maxs/valid_counts (n_cols,).
+        """
+        n_rows, n_cols = block.shape
+        n_bin_opts = bin_counts.shape[0]
+
+        for j in prange(n_cols):
+            buf = np.empty(n_rows, dtype=block.dtype)
+            n_valid = 0
+            mn = np.inf
+            mx = -np.inf
+            for i in range(n_rows):
+                v = block[i, j]
+                if not np.isnan(v):
+                    buf[n_valid] = v
+                    n_valid += 1
+                    if v < mn:
+                        mn = v
+                    if v > mx:
+                        mx = v
+
+            valid_counts[j] = n_valid
+            mins[j] = mn
+            maxs[j] = mx
+            if n_valid == 0:
+                lowers[j] = np.nan
+                uppers[j] = np.nan
+                for i in range(n_rows):
+                    capped[i, j] = np.nan
+                    for b in range(n_bin_opts):
+                        bins[b, i, j] = -1
+                continue
+
+            sorted_vals = np.sort(buf[:n_valid])
+            lo = _quantile_sorted(sorted_vals, pct_lo / 100.0)
+            hi = _quantile_sorted(sorted_vals, pct_hi / 100.0)
+            lowers[j] = lo
+            uppers[j] = hi
+            span = mx - mn
+
+            for i in range(n_rows):
+                v = block[i, j]
+                if np.isnan(v):
+                    capped[i, j] = np.nan
+                    for b in range(n_bin_opts):
+                        bins[b, i, j] = -1
+                else:
+                    capped[i, j] = lo if v < lo else (hi if v > hi else v)
+                    for b in range(n_bin_opts):
+                        nb = bin_counts[b]
+                        if span > 0:
+                            k = int((v - mn) / span * nb)
+                            if k >= nb:
+                                k = nb - 1
+                            bins[b, i, j] = k
+                        else:
+                            bins[b, i, j] = 0
+
+    @njit(cache=True)
+    def remap_codes(codes, table):
+        """
+        Gather new category codes through a remap table in one scan.
+
+        codes holds the original categorical codes (-1 for missing),
+        table maps each original code to its grouped code. Missing stays
+        -1. Returns the remapped int codes.
+        """
+        out = np.empty(codes.shape[0], dtype=table.dtype)
+        for i in range(codes.shape[0]):
+            c = codes[i]
+            out[i] = table[c] if c >= 0 else -1
+        return out
+
+else:
+    fit_capped_binned = None
+    remap_codes = None
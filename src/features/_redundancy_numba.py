@@ -0,0 +1,61 @@
+"""
+Optional Numba Redundancy Kernel
+Compiled greedy redundancy scan over a precomputed |correlation| matrix
+
+Numba is an optional dependency: when it is not installed,
+NUMBA_AVAILABLE is False and FeatureSelector keeps using the
+Python-level selection loop.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def greedy_redundancy(C, order, thr, top_k):
+        """
+        Walk candidate columns in ranked order, keeping each one unless
+        its |correlation| with an already-kept column exceeds thr.
+
+        C is the (P, P) absolute correlation matrix, order the candidate
+        column indices ranked best-first, top_k the selection cap
+        (negative means unlimited). Returns (picked, partner), both
+        aligned with order: picked[c] is True for kept candidates,
+        partner[c] is the most-correlated kept column for redundant ones
+        and -1 otherwise.
+        """
+        n = order.shape[0]
+        picked = np.zeros(n, dtype=np.bool_)
+        partner = np.full(n, -1, dtype=np.int64)
+        selected = np.empty(n, dtype=np.int64)
+        n_sel = 0
+
+        for c in range(n):
+            if top_k >= 0 and n_sel >= top_k:
+                break
+            j = order[c]
+
+            worst_idx = -1
+            worst_val = -1.0
+            for s in range(n_sel):
+                v = C[j, selected[s]]
+                if v > worst_val:
+                    worst_val = v
+                    worst_idx = selected[s]
+
+            if n_sel > 0 and worst_val > thr:
+                partner[c] = worst_idx
+            else:
+                selected[n_sel] = j
+                n_sel += 1
+                picked[c] = True
+
+        return picked, partner
+
+else:
+    greedy_redundancy = None
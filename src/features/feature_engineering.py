@@ -2,11 +2,80 @@
 Feature Engineering Module
 Transforms numerical and categorical features with tracking
 """
+import json
+import os
+import warnings
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
+from joblib import Parallel, delayed
+from typing import Callable, Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 
+from src.features.feature_stats import FeatureStats
+from src.features._numba_kernels import fit_capped_binned, remap_codes
+
+# Below this row count the NumPy path wins; the fused kernel only pays
+# off once per-column scan cost dominates
+_NUMBA_MIN_ROWS = 100_000
+
+# Grouped categorical output uses Arrow-backed strings when pyarrow is
+# installed (contiguous buffers instead of per-row Python objects);
+# plain pandas string dtype otherwise
+try:
+    import pyarrow  # noqa: F401
+    _GROUPED_STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    _GROUPED_STRING_DTYPE = "string"
+
+# Version tag for persisted fitted state (save_state/load_state)
+_STATE_VERSION = 1
+
+# Canonical label for grouped rare categories: one short constant string
+# instead of joining category names per column, which bloats every
+# mapping dict with long keys
+_RARE_OTHER_LABEL = "__rare_other__"
+
+# Opt in to Copy-on-Write so df.assign() reuses existing column arrays as
+# views instead of copying them (default behavior from pandas 3.0 onward).
+if tuple(int(p) for p in pd.__version__.split('.')[:1]) == (2,):
+    pd.options.mode.copy_on_write = True
+
+
+def _fast_tail_percentiles(block: np.ndarray, percentiles: Tuple[float, float]):
+    """
+    Per-column (lower, upper) percentiles of a 2D block
+
+    Columns without NaN use np.partition — expected O(N) introselect
+    instead of the full sort inside np.nanpercentile, which pays off for
+    tail percentiles like (1, 99). Columns containing NaN fall back to
+    np.nanpercentile. Linear interpolation matches np.percentile.
+    """
+    n_rows, n_cols = block.shape
+    lowers = np.empty(n_cols, dtype=block.dtype)
+    uppers = np.empty(n_cols, dtype=block.dtype)
+    q_lo = float(percentiles[0]) / 100.0
+    q_hi = float(percentiles[1]) / 100.0
+
+    has_nan = np.isnan(block).any(axis=0)
+    for j in range(n_cols):
+        col = block[:, j]
+        if has_nan[j]:
+            lowers[j], uppers[j] = np.nanpercentile(col, percentiles)
+            continue
+
+        pos_lo = q_lo * (n_rows - 1)
+        pos_hi = q_hi * (n_rows - 1)
+        k_lo, f_lo = int(pos_lo), pos_lo - int(pos_lo)
+        k_hi, f_hi = int(pos_hi), pos_hi - int(pos_hi)
+        k_lo1 = min(k_lo + 1, n_rows - 1)
+        k_hi1 = min(k_hi + 1, n_rows - 1)
+
+        part = np.partition(col, tuple(sorted({k_lo, k_lo1, k_hi, k_hi1})))
+        lowers[j] = part[k_lo] + f_lo * (part[k_lo1] - part[k_lo])
+        uppers[j] = part[k_hi] + f_hi * (part[k_hi1] - part[k_hi])
+
+    return lowers, uppers
+
 
 @dataclass
 class FeatureTransformConfig:
@@ -17,6 +86,14 @@ class FeatureTransformConfig:
 
     # Categorical transformations
     min_category_freq: float = 0.01  # Minimum frequency to keep category separate
+    # Optional custom label for the grouped rare bucket, called with the
+    # rare-category list (defaults to the canonical "__rare_other__")
+    rare_label_fmt: Optional[Callable[[List[str]], str]] = None
+
+    # Working dtypes: float32 halves memory bandwidth vs float64 and the
+    # bin indices (<= max(n_bins_options)) easily fit in int8
+    working_dtype: np.dtype = np.float32
+    bin_index_dtype: np.dtype = np.int8
 
 
 class FeatureEngineer:
@@ -29,7 +106,10 @@ class FeatureEngineer:
     - feature_binned_20: discretized into 20 bins
 
     For categorical features:
-    - Groups rare categories into cat1_cat2_cat3_other
+    - Groups rare categories under a single "__rare_other__" label
+      (customizable via config.rare_label_fmt)
+    - Grouped columns use pandas string dtype (Arrow-backed when pyarrow
+      is installed) rather than object or category dtype
 
     Binary features (2 unique values) are kept as-is without transformation.
     """
@@ -37,33 +117,80 @@ class FeatureEngineer:
     def __init__(self, config: Optional[FeatureTransformConfig] = None):
         self.config = config or FeatureTransformConfig()
         self.transform_stats = {}  # Store transformation parameters
-        self.feature_mapping = {}  # Original -> transformed features
+        # Structure-of-arrays mapping: one entry per transformed column,
+        # kept as parallel lists so summaries build straight from columns
+        self._map_original = []
+        self._map_transformed = []
+        self._map_types = []
         self.binary_features = []  # Track binary features
         self.target_col = None  # Target column to exclude
-
-    def detect_binary_features(self, df: pd.DataFrame, columns: List[str]) -> List[str]:
+        self._nunique_cache = {}  # Per-frame nunique cache
+        self._nunique_cache_key = None
+        # Fit-state version; bumped on every mapping mutation so the
+        # summary/list caches invalidate automatically on refit
+        self._version = 0
+        self._list_cache = None
+        self._summary_cache = None
+
+    def detect_binary_features(
+        self,
+        df: pd.DataFrame,
+        columns: List[str],
+        stats: Optional[FeatureStats] = None
+    ) -> List[str]:
         """
         Detect binary features (features with exactly 2 unique values)
 
         Args:
             df: Input dataframe
             columns: List of columns to check
+            stats: Precomputed FeatureStats to reuse instead of rescanning
 
         Returns:
             List of binary feature names
         """
-        binary_features = []
-        for col in columns:
-            n_unique = df[col].nunique()
-            if n_unique == 2:
-                binary_features.append(col)
-                unique_vals = df[col].dropna().unique()
-                self.transform_stats[col] = {
-                    'type': 'binary',
-                    'unique_values': unique_vals.tolist()
-                }
+        # Single vectorized nunique pass instead of one scan per column;
+        # cached per frame since numerical and categorical fits share the df
+        if self._nunique_cache_key != id(df):
+            self._nunique_cache_key = id(df)
+            self._nunique_cache = {}
+
+        if stats is not None:
+            self._nunique_cache.update(
+                {col: stats.nunique[col] for col in columns if col in stats.nunique}
+            )
+
+        uncached = [col for col in columns if col not in self._nunique_cache]
+        if uncached:
+            self._nunique_cache.update(df[uncached].nunique(dropna=True).to_dict())
+
+        binary_features = [col for col in columns if self._nunique_cache[col] == 2]
+        for col in binary_features:
+            # unique() then a mask over (at most 3) values avoids the
+            # full-column dropna copy
+            uniques = df[col].unique()
+            unique_vals = uniques[~pd.isna(uniques)]
+            self.transform_stats[col] = {
+                'type': 'binary',
+                'unique_values': unique_vals.tolist()
+            }
         return binary_features
 
+    @property
+    def feature_mapping(self) -> Dict[str, List[str]]:
+        """Original -> transformed features, rebuilt from the SoA lists"""
+        mapping = {}
+        for original, transformed in zip(self._map_original, self._map_transformed):
+            mapping.setdefault(original, []).append(transformed)
+        return mapping
+
+    def _record_mapping(self, original: str, transformed: str, transform_type: str):
+        """Register one original -> transformed column pair"""
+        self._map_original.append(original)
+        self._map_transformed.append(transformed)
+        self._map_types.append(transform_type)
+        self._version += 1
+
     def set_target(self, target_col: str):
         """Set target column to exclude from transformations"""
         self.target_col = target_col
@@ -72,7 +199,8 @@ class FeatureEngineer:
         self,
         df: pd.DataFrame,
         numerical_cols: List[str],
-        target_col: Optional[str] = None
+        target_col: Optional[str] = None,
+        stats: Optional[FeatureStats] = None
     ) -> pd.DataFrame:
         """
         Create transformed versions of numerical features
@@ -81,6 +209,7 @@ class FeatureEngineer:
             df: Input dataframe
             numerical_cols: List of numerical column names
             target_col: Target column to exclude from transformations
+            stats: Precomputed FeatureStats to reuse for binary detection
 
         Returns:
             DataFrame with original + transformed features
@@ -89,11 +218,13 @@ class FeatureEngineer:
         if target_col:
             self.target_col = target_col
 
-        df_transformed = df.copy()
+        # Collect derived columns and attach them in one assign() at the end:
+        # memory stays O(new columns) instead of copying the whole frame
+        new_cols = {}
 
         # Detect binary features (excluding target)
         cols_to_check = [col for col in numerical_cols if col != self.target_col]
-        binary_cols = self.detect_binary_features(df, cols_to_check)
+        binary_cols = self.detect_binary_features(df, cols_to_check, stats=stats)
         self.binary_features.extend(binary_cols)
 
         # Filter out target and binary features
@@ -110,20 +241,110 @@ class FeatureEngineer:
 
         # Mark binary features as-is (no transformation)
         for col in binary_cols:
-            self.feature_mapping[col] = [col]  # Keep as-is
-
-        for col in cols_to_transform:
-            # Store original feature mapping
-            self.feature_mapping[col] = []
+            self._record_mapping(col, col, 'binary')  # Keep as-is
+
+        # Degenerate columns (constant or all-missing) gain nothing from
+        # capping or binning — drop them before the block pass instead of
+        # paying percentile/clip/digitize work the filter discards later
+        if cols_to_transform:
+            # detect_binary_features above already filled the per-frame
+            # nunique cache for every checked column, computing counts for
+            # any column a caller-supplied stats does not cover
+            nun = self._nunique_cache
+            degenerate = [col for col in cols_to_transform if nun[col] <= 1]
+            if degenerate:
+                print(f"ℹ  Degenerate columns skipped (constant or empty): {degenerate}")
+                for col in degenerate:
+                    self._record_mapping(col, col, 'none')
+                degenerate_set = set(degenerate)
+                cols_to_transform = [
+                    col for col in cols_to_transform if col not in degenerate_set
+                ]
+
+        # Compute cap bounds and clip in one C-level pass over the whole
+        # numeric block instead of a percentile call per column. On large
+        # inputs the optional numba kernel fuses percentile, clip and
+        # binning so each column is scanned once instead of per operation.
+        use_numba = False
+        if cols_to_transform:
+            # Column-major layout so the per-column percentile/clip/digitize
+            # kernels and the block[:, i] slices below are all unit-stride
+            block = np.asfortranarray(
+                df[cols_to_transform].to_numpy(dtype=self.config.working_dtype)
+            )
+            n_rows, n_block_cols = block.shape
+            use_numba = fit_capped_binned is not None and n_rows >= _NUMBA_MIN_ROWS
+
+            if use_numba:
+                bin_counts = np.asarray(self.config.n_bins_options, dtype=np.int64)
+                capped_block = np.empty_like(block)
+                bins_block = np.empty(
+                    (len(bin_counts), n_rows, n_block_cols),
+                    dtype=self.config.bin_index_dtype
+                )
+                lowers = np.empty(n_block_cols, dtype=block.dtype)
+                uppers = np.empty(n_block_cols, dtype=block.dtype)
+                mins = np.empty(n_block_cols, dtype=block.dtype)
+                maxs = np.empty(n_block_cols, dtype=block.dtype)
+                valid_counts = np.empty(n_block_cols, dtype=np.int64)
+                fit_capped_binned(
+                    block,
+                    float(self.config.cap_percentiles[0]),
+                    float(self.config.cap_percentiles[1]),
+                    bin_counts,
+                    capped_block, bins_block,
+                    lowers, uppers, mins, maxs, valid_counts
+                )
+            else:
+                lowers, uppers = _fast_tail_percentiles(
+                    block, self.config.cap_percentiles
+                )
+                capped_block = np.clip(block, lowers, uppers)
+
+                # One block-wide pass for the binning prerequisites too:
+                # NaN mask, valid counts and min/max land as arrays instead
+                # of a scan per column inside the loop below
+                nan_mask_block = np.isnan(block)
+                valid_counts = n_rows - nan_mask_block.sum(axis=0)
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', category=RuntimeWarning)
+                    mins = np.nanmin(block, axis=0)
+                    maxs = np.nanmax(block, axis=0)
+
+                # Digitize every column up front. np.digitize releases
+                # the GIL, so on wide + tall frames a thread per column
+                # scales across cores; small frames stay serial to avoid
+                # pool overhead.
+                def _digitize_one(i):
+                    arr_i = block[:, i]
+                    nan_i = nan_mask_block[:, i]
+                    out = []
+                    for n_bins in self.config.n_bins_options:
+                        if valid_counts[i] >= n_bins and mins[i] < maxs[i]:
+                            edges_i = np.linspace(mins[i], maxs[i], n_bins + 1)
+                            bins_i = np.digitize(arr_i, edges_i[1:-1])
+                            out.append(
+                                np.where(nan_i, -1, bins_i)
+                                .astype(self.config.bin_index_dtype)
+                            )
+                        else:
+                            out.append(None)
+                    return out
+
+                if n_block_cols > 1 and n_rows >= _NUMBA_MIN_ROWS:
+                    n_workers = min(n_block_cols, os.cpu_count() or 1)
+                    digitized = Parallel(n_jobs=n_workers, backend='threading')(
+                        delayed(_digitize_one)(i) for i in range(n_block_cols)
+                    )
+                else:
+                    digitized = [_digitize_one(i) for i in range(n_block_cols)]
 
+        for i, col in enumerate(cols_to_transform):
             # 1. Capped version
-            lower, upper = np.percentile(
-                df[col].dropna(),
-                self.config.cap_percentiles
-            )
+            lower, upper = lowers[i], uppers[i]
             capped_col = f"{col}_capped"
-            df_transformed[capped_col] = df[col].clip(lower, upper)
-            self.feature_mapping[col].append(capped_col)
+            new_cols[capped_col] = pd.Series(capped_block[:, i], index=df.index)
+            self._record_mapping(col, capped_col, 'capped')
 
             # Store stats for reproduction
             self.transform_stats[capped_col] = {
@@ -132,36 +353,36 @@ class FeatureEngineer:
                 'upper': upper
             }
 
-            # 2. Binned versions
-            for n_bins in self.config.n_bins_options:
+            # 2. Binned versions: bin indices were already computed block
+            # wide (numba kernel) or per column above (digitize pass), so
+            # this loop only records stats and wraps the arrays
+            n_valid = int(valid_counts[i])
+            mn, mx = mins[i], maxs[i]
+
+            for bin_idx, n_bins in enumerate(self.config.n_bins_options):
                 binned_col = f"{col}_binned_{n_bins}"
 
                 # Check if we have enough valid values for binning
-                valid_values = df[col].dropna()
-                if len(valid_values) >= n_bins:
-                    try:
-                        df_transformed[binned_col], bins = pd.cut(
-                            df[col],
-                            bins=n_bins,
-                            retbins=True,
-                            labels=False,
-                            duplicates='drop'
-                        )
-                        self.feature_mapping[col].append(binned_col)
-
-                        # Store stats
-                        self.transform_stats[binned_col] = {
-                            'type': 'binned',
-                            'n_bins': n_bins,
-                            'bin_edges': bins.tolist()
-                        }
-                    except Exception as e:
-                        # Skip binning if it fails (e.g., too many missing values)
-                        print(f"Warning: Could not bin {col} with {n_bins} bins: {e}")
+                if n_valid >= n_bins and mn < mx:
+                    edges = np.linspace(mn, mx, n_bins + 1)
+                    if use_numba:
+                        bins = bins_block[bin_idx, :, i]
+                    else:
+                        bins = digitized[i][bin_idx]
+                    new_cols[binned_col] = pd.Series(bins, index=df.index)
+                    self._record_mapping(col, binned_col, 'binned')
+
+                    # Store stats
+                    self.transform_stats[binned_col] = {
+                        'type': 'binned',
+                        'n_bins': n_bins,
+                        'bin_edges': edges.tolist(),
+                        '_edges_array': edges  # Ready for the searchsorted path
+                    }
                 else:
-                    print(f"Warning: Skipping binning for {col} (insufficient valid values: {len(valid_values)} < {n_bins})")
+                    print(f"Warning: Skipping binning for {col} (insufficient valid values: {n_valid} < {n_bins})")
 
-        return df_transformed
+        return df.assign(**new_cols)
 
     def transform_numerical(
         self,
@@ -169,36 +390,52 @@ class FeatureEngineer:
         numerical_cols: List[str]
     ) -> pd.DataFrame:
         """Apply fitted transformations to new data"""
-        df_transformed = df.copy()
+        new_cols = {}
+        mapping = self.feature_mapping
 
         for col in numerical_cols:
-            if col not in self.feature_mapping:
+            if col not in mapping:
                 raise ValueError(f"Feature {col} not fitted. Call fit_transform first.")
 
-            for transformed_col in self.feature_mapping[col]:
-                stats = self.transform_stats[transformed_col]
+            # Bind the column once; repeated df[col] lookups each pay a
+            # pandas __getitem__ plus Series construction
+            series = df[col]
+            arr = series.to_numpy(dtype=self.config.working_dtype)
+
+            for transformed_col in mapping[col]:
+                # Binary and degenerate columns map to themselves with no
+                # stored parameters — pass them through unchanged
+                stats = self.transform_stats.get(transformed_col)
+                if stats is None:
+                    continue
 
                 if stats['type'] == 'capped':
-                    df_transformed[transformed_col] = df[col].clip(
-                        stats['lower'],
-                        stats['upper']
+                    # np.clip on the float32 buffer bound above — same
+                    # dtype and code path as the fit-time block clip
+                    new_cols[transformed_col] = pd.Series(
+                        np.clip(arr, stats['lower'], stats['upper']),
+                        index=df.index
                     )
                 elif stats['type'] == 'binned':
-                    df_transformed[transformed_col] = pd.cut(
-                        df[col],
-                        bins=stats['bin_edges'],
-                        labels=False,
-                        include_lowest=True,
-                        duplicates='drop'
-                    )
-
-        return df_transformed
+                    # One vectorized binary search over cached edges
+                    # instead of pd.cut revalidating bins on every call
+                    edges = stats.get('_edges_array')
+                    if edges is None:
+                        edges = np.asarray(stats['bin_edges'])
+                        stats['_edges_array'] = edges
+                    bins = np.searchsorted(edges[1:-1], arr, side='right')
+                    # Same -1 sentinel for missing values as the fit path
+                    bins = np.where(np.isnan(arr), -1, bins).astype(self.config.bin_index_dtype)
+                    new_cols[transformed_col] = pd.Series(bins, index=df.index)
+
+        return df.assign(**new_cols)
 
     def fit_transform_categorical(
         self,
         df: pd.DataFrame,
         categorical_cols: List[str],
-        target_col: Optional[str] = None
+        target_col: Optional[str] = None,
+        stats: Optional[FeatureStats] = None
     ) -> pd.DataFrame:
         """
         Group rare categories together
@@ -210,6 +447,7 @@ class FeatureEngineer:
             df: Input dataframe
             categorical_cols: List of categorical column names
             target_col: Target column to exclude from transformations
+            stats: Precomputed FeatureStats to reuse for binary detection
 
         Returns:
             DataFrame with original + transformed features
@@ -218,11 +456,11 @@ class FeatureEngineer:
         if target_col:
             self.target_col = target_col
 
-        df_transformed = df.copy()
+        new_cols = {}
 
         # Detect binary features (excluding target)
         cols_to_check = [col for col in categorical_cols if col != self.target_col]
-        binary_cols = self.detect_binary_features(df, cols_to_check)
+        binary_cols = self.detect_binary_features(df, cols_to_check, stats=stats)
         self.binary_features.extend(binary_cols)
 
         # Filter out target and binary features
@@ -239,46 +477,92 @@ class FeatureEngineer:
 
         # Mark binary features as-is (no transformation)
         for col in binary_cols:
-            if col not in self.feature_mapping:
-                self.feature_mapping[col] = [col]  # Keep as-is
+            if col not in self._map_original:
+                self._record_mapping(col, col, 'binary')  # Keep as-is
 
         for col in cols_to_transform:
-            # Calculate frequency of each category
-            freq = df[col].value_counts(normalize=True)
+            series = df[col]
+
+            # One factorization per column: categorical columns reuse
+            # their codes, object/string columns hash once into codes,
+            # and every count comes from a single bincount — no
+            # value_counts Series is ever built
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes = series.cat.codes.to_numpy()
+                cats = series.cat.categories.to_numpy()
+            else:
+                cat = pd.Categorical(series)
+                codes = cat.codes
+                cats = cat.categories.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(cats))
+            total = counts.sum()
+            freqs = counts / total if total else np.zeros(len(cats))
 
             # Find rare categories
-            rare_categories = freq[freq < self.config.min_category_freq].index.tolist()
+            rare_mask = freqs < self.config.min_category_freq
+            rare_categories = cats[rare_mask].tolist()
 
             if rare_categories:
                 # Create grouped column name
                 grouped_col = f"{col}_grouped"
 
-                # Create mapping
-                category_mapping = {cat: cat for cat in freq.index}
-
-                # Group rare categories
-                other_label = "_".join(rare_categories[:3]) + "_other" if len(rare_categories) <= 3 else \
-                              "_".join(rare_categories[:2]) + "_other"
-
-                for rare_cat in rare_categories:
-                    category_mapping[rare_cat] = other_label
-
-                # Apply mapping
-                df_transformed[grouped_col] = df[col].map(category_mapping)
+                # Group rare categories under one canonical label; the
+                # rare list itself stays recoverable from transform_stats
+                if self.config.rare_label_fmt is not None:
+                    other_label = self.config.rare_label_fmt(rare_categories)
+                else:
+                    other_label = _RARE_OTHER_LABEL
+
+                # Build the mapping from arrays in one zip instead of a
+                # per-category Python loop
+                category_mapping = dict(zip(
+                    cats.tolist(),
+                    np.where(rare_mask, other_label, cats).tolist()
+                ))
+
+                # Remap old codes to grouped codes: kept categories
+                # compact to the front, every rare one shares the final
+                # "other" slot
+                kept_mask = ~rare_mask
+                table = np.where(
+                    kept_mask, np.cumsum(kept_mask) - 1, int(kept_mask.sum())
+                ).astype(np.int32)
+                if remap_codes is not None and len(codes) >= _NUMBA_MIN_ROWS:
+                    new_codes = remap_codes(codes.astype(np.int64), table)
+                else:
+                    new_codes = np.where(codes >= 0, table[codes], -1)
+
+                grouped_categories = np.append(
+                    cats[kept_mask], other_label
+                ).tolist()
+                grouped = pd.Categorical.from_codes(
+                    new_codes, categories=grouped_categories
+                )
+                new_cols[grouped_col] = pd.Series(
+                    grouped, index=df.index
+                ).astype(_GROUPED_STRING_DTYPE)
 
                 # Store mapping
-                self.feature_mapping[col] = [grouped_col]
+                self._record_mapping(col, grouped_col, 'categorical_grouped')
                 self.transform_stats[grouped_col] = {
                     'type': 'categorical_grouped',
                     'mapping': category_mapping,
                     'rare_categories': rare_categories,
+                    'other_label': other_label,
                     'min_freq': self.config.min_category_freq
                 }
+                # Replay transforms on matching categoricals via the
+                # code table instead of per-value mapping
+                self.transform_stats[grouped_col].update({
+                    '_code_table': table,
+                    '_fit_categories': cats.tolist(),
+                    '_grouped_categories': grouped_categories
+                })
             else:
                 # No grouping needed
-                self.feature_mapping[col] = [col]
+                self._record_mapping(col, col, 'none')
 
-        return df_transformed
+        return df.assign(**new_cols)
 
     def transform_categorical(
         self,
@@ -286,42 +570,171 @@ class FeatureEngineer:
         categorical_cols: List[str]
     ) -> pd.DataFrame:
         """Apply fitted categorical transformations to new data"""
-        df_transformed = df.copy()
+        new_cols = {}
+        feature_map = self.feature_mapping
 
         for col in categorical_cols:
-            if col not in self.feature_mapping:
+            if col not in feature_map:
                 raise ValueError(f"Feature {col} not fitted. Call fit_transform first.")
 
-            for transformed_col in self.feature_mapping[col]:
+            series = df[col]
+            for transformed_col in feature_map[col]:
                 if transformed_col != col:  # If grouping was applied
                     stats = self.transform_stats[transformed_col]
                     mapping = stats['mapping']
 
-                    # Apply mapping with default for unseen categories
-                    default_label = list(stats['rare_categories'])[0] + "_other" \
-                                   if stats['rare_categories'] else 'unknown'
-                    df_transformed[transformed_col] = df[col].map(
-                        lambda x: mapping.get(x, default_label)
+                    # Categorical input with the fitted category set goes
+                    # through the cached code table; anything else maps
+                    # per value with a default for unseen categories
+                    table = stats.get('_code_table')
+                    if (
+                        table is not None
+                        and isinstance(series.dtype, pd.CategoricalDtype)
+                        and list(series.cat.categories) == stats['_fit_categories']
+                    ):
+                        codes = series.cat.codes.to_numpy()
+                        if remap_codes is not None and len(codes) >= _NUMBA_MIN_ROWS:
+                            new_codes = remap_codes(codes.astype(np.int64), table)
+                        else:
+                            new_codes = np.where(codes >= 0, table[codes], -1)
+                        grouped = pd.Categorical.from_codes(
+                            new_codes, categories=stats['_grouped_categories']
+                        )
+                        new_cols[transformed_col] = pd.Series(
+                            grouped, index=df.index
+                        ).astype(_GROUPED_STRING_DTYPE)
+                        continue
+
+                    # map(dict) + fillna stays in C instead of calling a
+                    # Python lambda per row
+                    default_label = stats.get('other_label', _RARE_OTHER_LABEL)
+                    new_cols[transformed_col] = (
+                        series.map(mapping).fillna(default_label).astype(_GROUPED_STRING_DTYPE)
                     )
 
-        return df_transformed
+        return df.assign(**new_cols)
+
+    def save_state(self, path: str):
+        """
+        Persist fitted state to <path>.npz plus a <path>.json sidecar
+
+        Numeric parameters (cap bounds, bin edges) go into a single npz so
+        load_state rebuilds ready-to-use arrays without per-column list
+        conversion; category mappings and bookkeeping are JSON.
+
+        Args:
+            path: Base path without extension
+        """
+        capped_names, capped_lowers, capped_uppers = [], [], []
+        binned_names, binned_n_bins, bin_edges = [], [], []
+        json_stats = {}
+
+        for name, stats in self.transform_stats.items():
+            if stats['type'] == 'capped':
+                capped_names.append(name)
+                capped_lowers.append(stats['lower'])
+                capped_uppers.append(stats['upper'])
+            elif stats['type'] == 'binned':
+                binned_names.append(name)
+                binned_n_bins.append(stats['n_bins'])
+                bin_edges.append(np.asarray(stats['bin_edges'], dtype=np.float64))
+            else:
+                # Binary / categorical stats are JSON-friendly; drop
+                # transient cache entries (underscore-prefixed)
+                json_stats[name] = {
+                    k: v for k, v in stats.items() if not k.startswith('_')
+                }
+
+        np.savez(
+            f"{path}.npz",
+            version=np.int64(_STATE_VERSION),
+            capped_names=np.array(capped_names),
+            capped_lowers=np.array(capped_lowers, dtype=np.float64),
+            capped_uppers=np.array(capped_uppers, dtype=np.float64),
+            binned_names=np.array(binned_names),
+            binned_n_bins=np.array(binned_n_bins, dtype=np.int64),
+            bin_edges_flat=np.concatenate(bin_edges) if bin_edges else np.empty(0),
+            bin_edge_lengths=np.array([len(e) for e in bin_edges], dtype=np.int64)
+        )
+
+        sidecar = {
+            'version': _STATE_VERSION,
+            'map_original': self._map_original,
+            'map_transformed': self._map_transformed,
+            'map_types': self._map_types,
+            'binary_features': self.binary_features,
+            'target_col': self.target_col,
+            'stats': json_stats
+        }
+        with open(f"{path}.json", 'w') as f:
+            json.dump(sidecar, f)
+
+    def load_state(self, path: str) -> 'FeatureEngineer':
+        """
+        Restore fitted state saved by save_state
+
+        Args:
+            path: Base path without extension (expects <path>.npz + <path>.json)
+
+        Returns:
+            self
+        """
+        with open(f"{path}.json") as f:
+            sidecar = json.load(f)
+        if sidecar.get('version') != _STATE_VERSION:
+            raise ValueError(
+                f"Unsupported state version: {sidecar.get('version')} "
+                f"(expected {_STATE_VERSION})"
+            )
+
+        self._map_original = list(sidecar['map_original'])
+        self._map_transformed = list(sidecar['map_transformed'])
+        self._map_types = list(sidecar['map_types'])
+        self.binary_features = list(sidecar['binary_features'])
+        self.target_col = sidecar['target_col']
+        self.transform_stats = dict(sidecar['stats'])
+
+        with np.load(f"{path}.npz") as state:
+            for name, lower, upper in zip(
+                state['capped_names'], state['capped_lowers'], state['capped_uppers']
+            ):
+                self.transform_stats[str(name)] = {
+                    'type': 'capped',
+                    'lower': float(lower),
+                    'upper': float(upper)
+                }
+
+            offset = 0
+            edges_flat = state['bin_edges_flat']
+            for name, n_bins, length in zip(
+                state['binned_names'], state['binned_n_bins'], state['bin_edge_lengths']
+            ):
+                edges = edges_flat[offset:offset + int(length)].copy()
+                offset += int(length)
+                self.transform_stats[str(name)] = {
+                    'type': 'binned',
+                    'n_bins': int(n_bins),
+                    'bin_edges': edges.tolist(),
+                    '_edges_array': edges  # Ready for the searchsorted path
+                }
+
+        self._version += 1
+        return self
 
     def get_feature_list(self) -> List[str]:
-        """Get list of all transformed features"""
-        all_features = []
-        for original, transformed in self.feature_mapping.items():
-            all_features.extend(transformed)
-        return all_features
+        """Get list of all transformed features (memoized per fit state)"""
+        if self._list_cache is None or self._list_cache[0] != self._version:
+            self._list_cache = (self._version, list(self._map_transformed))
+        return list(self._list_cache[1])
 
     def get_feature_summary(self) -> pd.DataFrame:
-        """Get summary of all transformations"""
-        summary = []
-        for original, transformed in self.feature_mapping.items():
-            for trans_col in transformed:
-                stats = self.transform_stats.get(trans_col, {})
-                summary.append({
-                    'original_feature': original,
-                    'transformed_feature': trans_col,
-                    'transformation_type': stats.get('type', 'none')
-                })
-        return pd.DataFrame(summary)
+        """Get summary of all transformations (memoized per fit state)"""
+        if self._summary_cache is None or self._summary_cache[0] != self._version:
+            self._summary_cache = (self._version, pd.DataFrame({
+                'original_feature': self._map_original,
+                'transformed_feature': self._map_transformed,
+                'transformation_type': self._map_types
+            }))
+        # Hand out a copy so callers mutating the summary can't corrupt
+        # the cached frame (same defense as get_feature_list)
+        return self._summary_cache[1].copy()
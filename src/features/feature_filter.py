@@ -7,6 +7,26 @@ import numpy as np
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass, field
 
+from src.features.feature_stats import FeatureStats
+
+# Arrow-backed columns can serve missingness/cardinality/variance from
+# SIMD-vectorized pyarrow.compute kernels; NumPy-backed columns keep the
+# pandas path
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    _PYARROW_AVAILABLE = False
+
+# Polars runs the whole stats scan as one multithreaded Rust pass; when
+# it is not installed the pyarrow/pandas paths below take over
+try:
+    import polars as pl
+    _POLARS_AVAILABLE = True
+except ImportError:
+    _POLARS_AVAILABLE = False
+
 
 @dataclass
 class FeatureFilterConfig:
@@ -45,7 +65,8 @@ class FeatureFilter:
         df: pd.DataFrame,
         numerical_cols: Optional[List[str]] = None,
         categorical_cols: Optional[List[str]] = None,
-        target_col: Optional[str] = None
+        target_col: Optional[str] = None,
+        stats: Optional[FeatureStats] = None
     ) -> 'FeatureFilter':
         """
         Analyze features and determine which to keep
@@ -55,13 +76,14 @@ class FeatureFilter:
             numerical_cols: List of numerical columns (auto-detected if None)
             categorical_cols: List of categorical columns (auto-detected if None)
             target_col: Target column to exclude from filtering
+            stats: Precomputed FeatureStats to reuse instead of rescanning
 
         Returns:
             self
         """
         # Auto-detect column types if not provided
         if numerical_cols is None:
-            numerical_cols = df.select_dtypes(include=['int64', 'float64']).columns.tolist()
+            numerical_cols = df.select_dtypes(include=[np.number]).columns.tolist()
         if categorical_cols is None:
             categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
 
@@ -82,18 +104,30 @@ class FeatureFilter:
 
         self.filter_report = {}
 
-        # Check each feature
+        # Compute all stats in one vectorized pass per stat instead of
+        # three pandas calls per column
         n_rows = len(df)
+        if stats is not None:
+            miss_rates = stats.missing_rate
+            cards = stats.nunique
+            variances = stats.variance
+        else:
+            miss_rates, cards, variances = self._compute_stats(
+                df, all_features, numerical_cols
+            )
+
+        numerical_set = set(numerical_cols)
         for col in all_features:
-            cardinality = df[col].nunique()
+            cardinality = cards[col]
             cardinality_ratio = cardinality / n_rows if n_rows > 0 else 0
+            variance = variances.get(col)
 
             col_report = {
-                'type': 'numerical' if col in numerical_cols else 'categorical',
-                'missing_rate': df[col].isna().sum() / n_rows,
+                'type': 'numerical' if col in numerical_set else 'categorical',
+                'missing_rate': miss_rates[col],
                 'cardinality': cardinality,
                 'cardinality_ratio': cardinality_ratio,
-                'variance': df[col].var() if col in numerical_cols and pd.api.types.is_numeric_dtype(df[col]) else None,
+                'variance': variance,
                 'kept': True,
                 'removal_reason': None
             }
@@ -113,7 +147,7 @@ class FeatureFilter:
                 self.removed_features['all'].append(col)
 
             # Check 3: Zero variance (numerical only)
-            elif col in numerical_cols and col_report['variance'] is not None:
+            elif col in numerical_set and col_report['variance'] is not None:
                 if col_report['variance'] <= self.config.min_variance:
                     col_report['kept'] = False
                     col_report['removal_reason'] = 'zero_variance'
@@ -127,6 +161,97 @@ class FeatureFilter:
 
         return self
 
+    @staticmethod
+    def _compute_stats(
+        df: pd.DataFrame,
+        all_features: List[str],
+        numerical_cols: List[str]
+    ) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """
+        Compute missingness, cardinality and variance per column
+
+        Polars, when installed, computes everything in one multithreaded
+        lazy scan. Otherwise Arrow-backed columns go through
+        pyarrow.compute kernels when pyarrow is installed, and everything
+        else uses the vectorized pandas path.
+        """
+        if _POLARS_AVAILABLE:
+            return FeatureFilter._scan_stats_polars(df, all_features, numerical_cols)
+
+        numerical_set = set(numerical_cols)
+        arrow_cols = []
+        if _PYARROW_AVAILABLE:
+            arrow_cols = [
+                col for col in all_features
+                if hasattr(df[col].array, '_pa_array')
+            ]
+
+        miss, card, var = {}, {}, {}
+        for col in arrow_cols:
+            arr = df[col].array._pa_array
+            miss[col] = pc.mean(pc.cast(pc.is_null(arr), pa.float64())).as_py() or 0.0
+            card[col] = pc.count_distinct(arr).as_py()
+            if col in numerical_set:
+                var[col] = pc.variance(arr, ddof=1).as_py()
+
+        plain_cols = [col for col in all_features if col not in set(arrow_cols)]
+        if plain_cols:
+            # count() reduces non-nulls without materializing the boolean
+            # isna mask for every column
+            n_rows = len(df)
+            non_null = df[plain_cols].count()
+            miss.update(
+                ((1 - non_null / n_rows) if n_rows else non_null * 0.0).to_dict()
+            )
+            card.update(df[plain_cols].nunique(dropna=True).to_dict())
+            plain_numerical = [col for col in plain_cols if col in numerical_set]
+            if plain_numerical:
+                var.update(df[plain_numerical].var(numeric_only=True).to_dict())
+
+        return (
+            pd.Series(miss, dtype=float),
+            pd.Series(card, dtype='int64'),
+            pd.Series(var, dtype=float)
+        )
+
+    @staticmethod
+    def _scan_stats_polars(
+        df: pd.DataFrame,
+        all_features: List[str],
+        numerical_cols: List[str]
+    ) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """
+        Compute all filter statistics in a single lazy Polars select
+
+        One parallel pass over the columns replaces the per-statistic
+        pandas dispatches. drop_nulls before n_unique keeps cardinality
+        consistent with pandas' nunique(dropna=True).
+        """
+        n_rows = len(df)
+        exprs = [
+            pl.all().null_count().name.suffix('__nulls'),
+            pl.all().drop_nulls().n_unique().name.suffix('__nu'),
+        ]
+        if numerical_cols:
+            exprs.append(pl.col(numerical_cols).var().name.suffix('__var'))
+
+        row = (
+            pl.from_pandas(df[all_features])
+            .lazy()
+            .select(exprs)
+            .collect()
+            .row(0, named=True)
+        )
+
+        miss = {c: (row[f'{c}__nulls'] / n_rows if n_rows else 0.0) for c in all_features}
+        card = {c: row[f'{c}__nu'] for c in all_features}
+        var = {c: row[f'{c}__var'] for c in numerical_cols}
+        return (
+            pd.Series(miss, dtype=float),
+            pd.Series(card, dtype='int64'),
+            pd.Series(var, dtype=float)
+        )
+
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Remove filtered features from dataframe
@@ -153,10 +278,11 @@ class FeatureFilter:
         df: pd.DataFrame,
         numerical_cols: Optional[List[str]] = None,
         categorical_cols: Optional[List[str]] = None,
-        target_col: Optional[str] = None
+        target_col: Optional[str] = None,
+        stats: Optional[FeatureStats] = None
     ) -> pd.DataFrame:
         """Fit and transform in one step"""
-        self.fit(df, numerical_cols, categorical_cols, target_col)
+        self.fit(df, numerical_cols, categorical_cols, target_col, stats=stats)
         return self.transform(df)
 
     def get_filter_summary(self) -> pd.DataFrame:
@@ -2,13 +2,39 @@
 Feature Selection Module
 Ranks and selects the best features for modeling
 """
+import logging
+import os
+import warnings
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
 from sklearn.feature_selection import mutual_info_classif, mutual_info_regression, f_classif, f_regression
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
-from scipy.stats import spearmanr, pearsonr
+from sklearn.ensemble import (
+    RandomForestClassifier,
+    RandomForestRegressor,
+    HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor,
+)
+from sklearn.inspection import permutation_importance
+from scipy.stats import rankdata
+from joblib import Parallel, delayed
+
+from src.features._spearman_numba import spearman_cols
+from src.features._redundancy_numba import greedy_redundancy
+
+logger = logging.getLogger(__name__)
+
+# Optional GPU backend for the redundancy correlation matmul; cupy is
+# not a hard dependency and the numpy GEMM path is always available
+try:
+    import cupy as _cupy
+except ImportError:
+    _cupy = None
+
+# The numba Spearman kernel wins on small/medium matrices where numpy's
+# rank-allocation overhead dominates; beyond this the BLAS path is fine
+_SPEARMAN_NUMBA_MAX_ELEMS = 5_000_000
 
 
 @dataclass
@@ -27,9 +53,34 @@ class FeatureSelectionConfig:
     # Task type
     task: str = 'classification'  # 'classification' or 'regression'
 
-    # Random Forest parameters
+    # Tree-importance parameters
     rf_n_estimators: int = 100
     rf_random_state: int = 42
+    # Bootstrap sample cap per tree; None fits each tree on a full bootstrap
+    rf_max_samples: Optional[int] = 20000
+    # 'rf' = RandomForest Gini importance, 'hgb' = HistGradientBoosting +
+    # permutation importance (binned histograms, much less memory traffic)
+    rf_backend: str = 'rf'
+
+    # Mutual information parallelism (sklearn >= 1.5; ignored on older)
+    mi_n_jobs: int = -1
+
+    # Worker count for running the scoring methods concurrently;
+    # None sizes the pool to min(n_methods, n_cores)
+    n_jobs: Optional[int] = None
+
+    # Run the redundancy correlation matmul on the GPU via cupy when it
+    # is installed; ignored (CPU GEMM) otherwise
+    use_gpu: bool = False
+
+    # 0 silences per-fit progress output entirely (skips the string
+    # formatting too, which adds up in tight sweeps)
+    verbose: int = 1
+
+    # Row cap for the ranking scorers (MI, correlation, statistical);
+    # scores saturate well before this, so larger inputs are subsampled.
+    # None ranks on the full data. The forest keeps all rows.
+    rank_sample_size: Optional[int] = 20000
 
     def __post_init__(self):
         if self.methods is None:
@@ -50,11 +101,18 @@ class FeatureSelector:
     def __init__(self, config: Optional[FeatureSelectionConfig] = None):
         self.config = config or FeatureSelectionConfig()
         self.feature_scores = {}  # Method -> {feature: score}
+        self._normalized_scores = {}  # Method -> min-max scaled score array
         self.feature_rankings = {}  # Method -> [features sorted by importance]
         self.selected_features = []
         self.feature_summary = None
         self.removed_redundant = []  # Features removed due to correlation
         self.X_numeric = None  # Store for correlation calculation
+        self.rf_model_ = None  # Fitted forest cached by _tree_importance_scores
+
+    def _log(self, msg: str):
+        """Emit progress output unless config.verbose is 0"""
+        if self.config.verbose:
+            logger.info(msg)
 
     def fit(
         self,
@@ -74,227 +132,569 @@ class FeatureSelector:
             self
         """
         if feature_names is None:
-            feature_names = X.columns.tolist()
+            feature_names = tuple(X.columns)
+        else:
+            # Freeze once; tuples iterate faster in the hot loops below
+            # and never alias a caller-owned list
+            feature_names = tuple(feature_names)
 
         # Ensure X is numeric
         X_numeric = self._prepare_features(X)
 
+        # Materialize the target once; every scorer then shares the same
+        # contiguous ndarray instead of re-converting the Series
+        y = np.ascontiguousarray(np.asarray(y))
+
         # Store for correlation calculation
         self.X_numeric = X_numeric
         self.feature_names = feature_names
 
-        print(f"\n{'='*60}")
-        print("FEATURE SELECTION")
-        print('='*60)
-        print(f"Task: {self.config.task}")
-        print(f"Features: {len(feature_names)}")
-        print(f"Samples: {len(X)}")
-        print(f"Methods: {', '.join(self.config.methods)}")
-        print(f"Redundancy removal: max_correlation={self.config.max_correlation}")
-
-        # Compute scores with each method
-        for method in self.config.methods:
-            print(f"\nComputing {method} scores...")
-            try:
-                if method == 'mutual_info':
-                    scores = self._mutual_info_scores(X_numeric, y)
-                elif method == 'tree_importance':
-                    scores = self._tree_importance_scores(X_numeric, y)
-                elif method == 'correlation':
-                    scores = self._correlation_scores(X_numeric, y)
-                elif method == 'statistical':
-                    scores = self._statistical_scores(X_numeric, y)
-                else:
-                    print(f"  Warning: Unknown method '{method}', skipping")
-                    continue
-
-                self.feature_scores[method] = dict(zip(feature_names, scores))
-
-                # Rank features
-                ranked_features = sorted(
-                    zip(feature_names, scores),
-                    key=lambda x: x[1],
-                    reverse=True
-                )
-                self.feature_rankings[method] = [f[0] for f in ranked_features]
+        self._log(f"\n{'='*60}")
+        self._log("FEATURE SELECTION")
+        self._log('='*60)
+        self._log(f"Task: {self.config.task}")
+        self._log(f"Features: {len(feature_names)}")
+        self._log(f"Samples: {len(X)}")
+        self._log(f"Methods: {', '.join(self.config.methods)}")
+        self._log(f"Redundancy removal: max_correlation={self.config.max_correlation}")
+
+        # Near-constant columns carry no signal and can NaN out individual
+        # scorers (spearman, f_classif); drop them before any scorer runs
+        # and re-introduce them with score 0 afterwards
+        keep = np.nanvar(X_numeric, axis=0) > 1e-12
+        self._score_keep_mask = keep
+        X_scored = X_numeric if keep.all() else X_numeric[:, keep]
+        n_const = int((~keep).sum())
+        if n_const:
+            self._log(f"Skipping {n_const} near-constant features (scored 0)")
+
+        # Ranking scores saturate around tens of thousands of rows, so
+        # bigger inputs get one shared subsample; the forest and the
+        # redundancy correlation matrix keep the full data
+        sample_size = self.config.rank_sample_size
+        if sample_size is not None and len(X_scored) > sample_size:
+            rng = np.random.default_rng(self.config.rf_random_state)
+            idx = rng.choice(len(X_scored), sample_size, replace=False)
+            X_ranked = X_scored[idx]
+            y_ranked = y[idx]
+            self._log(f"Subsampling {sample_size} of {len(X_scored)} rows for ranking scorers")
+        else:
+            X_ranked, y_ranked = X_scored, y
+
+        # The scorers are independent of each other, so run them
+        # concurrently on threads — RF, the k-NN MI estimator and the
+        # BLAS-backed rank math all release the GIL
+        self._log("\nComputing scores for: " + ", ".join(self.config.methods))
+        n_workers = self.config.n_jobs
+        if n_workers is None:
+            n_workers = min(len(self.config.methods), os.cpu_count() or 1)
+        results = Parallel(n_jobs=n_workers, backend='threading')(
+            delayed(self._run_one_method)(method, X_ranked, y_ranked, X_scored, y)
+            for method in self.config.methods
+        )
 
-                print(f"  ✓ Computed {method} scores")
+        # Reduce serially so the shared dicts stay single-writer
+        for method, scores, error in results:
+            if error is not None:
+                logger.warning(f"Error computing {method}: {error}")
+                continue
+            if scores is None:
+                logger.warning(f"Unknown method '{method}', skipping")
+                continue
+
+            if n_const:
+                full_scores = np.zeros(len(feature_names))
+                full_scores[keep] = scores
+                scores = full_scores
+
+            self.feature_scores[method] = dict(zip(feature_names, scores))
+
+            # Cache the min-max normalized array so aggregation can
+            # stack methods directly instead of rebuilding from dicts
+            s = np.asarray(scores, dtype=float)
+            self._normalized_scores[method] = \
+                (s - np.nanmin(s)) / (np.nanmax(s) - np.nanmin(s) + 1e-12)
+
+            # Rank features
+            ranked_features = sorted(
+                zip(feature_names, scores),
+                key=lambda x: x[1],
+                reverse=True
+            )
+            self.feature_rankings[method] = [f[0] for f in ranked_features]
 
-            except Exception as e:
-                print(f"  ✗ Error computing {method}: {e}")
+            self._log(f"  ✓ Computed {method} scores")
 
         # Select features
         self._select_features(feature_names)
 
         return self
 
-    def _prepare_features(self, X: pd.DataFrame) -> np.ndarray:
-        """Convert features to numeric array, handling categoricals"""
-        X_numeric = X.copy()
-
-        # Convert categorical to numeric codes
-        for col in X_numeric.select_dtypes(include=['object', 'category']).columns:
-            X_numeric[col] = pd.Categorical(X_numeric[col]).codes
-
-        # Fill NaN with median
-        X_numeric = X_numeric.fillna(X_numeric.median())
+    def _run_one_method(
+        self,
+        method: str,
+        X_ranked: np.ndarray,
+        y_ranked: np.ndarray,
+        X_full: np.ndarray,
+        y_full: np.ndarray
+    ) -> Tuple[str, Optional[np.ndarray], Optional[Exception]]:
+        """
+        Run a single scoring method, returning (method, scores, error)
 
-        return X_numeric.values
+        scores is None for unknown methods; error carries the exception
+        when the scorer failed. Safe to call from worker threads: each
+        method only writes its own cached attributes.
+        """
+        try:
+            if method == 'mutual_info':
+                scores = self._mutual_info_scores(X_ranked, y_ranked)
+            elif method == 'tree_importance':
+                scores = self._tree_importance_scores(X_full, y_full)
+            elif method == 'correlation':
+                scores = self._correlation_scores(X_ranked, y_ranked)
+            elif method == 'statistical':
+                scores = self._statistical_scores(X_ranked, y_ranked)
+            else:
+                scores = None
+            return method, scores, None
+        except Exception as e:
+            return method, None, e
 
-    def _mutual_info_scores(self, X: np.ndarray, y: pd.Series) -> np.ndarray:
+    def _prepare_features(self, X: pd.DataFrame) -> np.ndarray:
+        """Convert features to numeric array, handling categoricals"""
+        # Write each column straight into one preallocated float32 buffer
+        # instead of copying the DataFrame, mutating it in place and
+        # converting at the end — one allocation, one pass per column
+        out = np.empty((len(X), X.shape[1]), dtype=np.float32)
+        cat_cols = set(
+            X.select_dtypes(include=['object', 'category', 'string']).columns
+        )
+        for i, col in enumerate(X.columns):
+            if col in cat_cols:
+                out[:, i] = pd.Categorical(X[col]).codes
+            else:
+                out[:, i] = X[col].to_numpy(dtype=np.float32, na_value=np.nan)
+
+        # Fill NaN with the column median in a single scatter
+        nan_mask = np.isnan(out)
+        if nan_mask.any():
+            medians = np.nanmedian(out, axis=0)
+            rows, cols = np.where(nan_mask)
+            out[rows, cols] = medians[cols]
+
+        return out
+
+    def _mutual_info_scores(self, X: np.ndarray, y: np.ndarray) -> np.ndarray:
         """Compute mutual information scores"""
-        if self.config.task == 'classification':
-            scores = mutual_info_classif(X, y, random_state=self.config.rf_random_state)
-        else:
-            scores = mutual_info_regression(X, y, random_state=self.config.rf_random_state)
-        return scores
+        mi_func = mutual_info_classif if self.config.task == 'classification' \
+            else mutual_info_regression
+
+        # Low-cardinality columns (binned/coded features) take the cheap
+        # contingency-table estimator instead of the k-NN density path
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        p = X.shape[1]
+        discrete = np.fromiter(
+            (np.unique(X[:, j]).size < 32 for j in range(p)),
+            dtype=bool, count=p
+        )
 
-    def _tree_importance_scores(self, X: np.ndarray, y: pd.Series) -> np.ndarray:
-        """Compute Random Forest feature importance"""
-        if self.config.task == 'classification':
-            model = RandomForestClassifier(
-                n_estimators=self.config.rf_n_estimators,
+        try:
+            # Per-feature MI estimates are independent; parallelize the
+            # k-NN searches across cores
+            scores = mi_func(
+                X, y,
+                discrete_features=discrete,
+                n_neighbors=3,
                 random_state=self.config.rf_random_state,
-                n_jobs=-1
+                n_jobs=self.config.mi_n_jobs
             )
-        else:
-            model = RandomForestRegressor(
-                n_estimators=self.config.rf_n_estimators,
+        except TypeError:
+            # sklearn < 1.5 has no n_jobs for mutual information
+            scores = mi_func(
+                X, y,
+                discrete_features=discrete,
+                n_neighbors=3,
+                random_state=self.config.rf_random_state
+            )
+        return scores
+
+    def _tree_importance_scores(self, X: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Compute tree-based feature importance"""
+        if self.config.rf_backend == 'hgb':
+            # Histogram-based boosting with early stopping is far cheaper
+            # to fit than a full forest; importance via permutation
+            hgb_cls = HistGradientBoostingClassifier \
+                if self.config.task == 'classification' else HistGradientBoostingRegressor
+            model = hgb_cls(
+                max_iter=self.config.rf_n_estimators,
+                early_stopping=True,
+                random_state=self.config.rf_random_state
+            )
+            model.fit(X, y)
+            result = permutation_importance(
+                model, X, y,
+                n_repeats=5,
                 random_state=self.config.rf_random_state,
                 n_jobs=-1
             )
+            return result.importances_mean
+
+        # Cap the bootstrap so each tree sees at most rf_max_samples rows;
+        # Gini importances stabilize well before full-sample bootstraps
+        max_samples = self.config.rf_max_samples
+        if max_samples is not None and max_samples >= len(X):
+            max_samples = None
+
+        # Grow the forest in chunks with warm_start and stop as soon as the
+        # importance ranking stabilizes — it usually converges long before
+        # the full ensemble is built
+        rf_cls = RandomForestClassifier \
+            if self.config.task == 'classification' else RandomForestRegressor
+        step = min(10, self.config.rf_n_estimators)
+        model = rf_cls(
+            n_estimators=step,
+            random_state=self.config.rf_random_state,
+            max_samples=max_samples,
+            warm_start=True,
+            n_jobs=-1
+        )
+
+        prev_importances = None
+        n_grown = 0
+        for n_trees in range(step, self.config.rf_n_estimators - step + 1, step):
+            model.n_estimators = n_trees
+            model.fit(X, y)
+            n_grown = n_trees
+            importances = model.feature_importances_
+            if prev_importances is not None:
+                rank_corr = np.corrcoef(
+                    rankdata(prev_importances), rankdata(importances)
+                )[0, 1]
+                if rank_corr > 0.99:
+                    break
+            prev_importances = importances
+
+        # The OOB estimate is only enabled for the last chunk, so it is
+        # computed once over the final ensemble instead of on every
+        # warm-start increment; small early ensembles can still leave a
+        # few rows without OOB predictions, so silence that advisory
+        model.set_params(oob_score=True)
+        model.n_estimators = min(n_grown + step, self.config.rf_n_estimators)
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                'ignore', message='Some inputs do not have OOB scores'
+            )
+            model.fit(X, y)
+
+        # Cache the fitted forest so callers can reuse it (OOB score,
+        # permutation importance) without refitting
+        self.rf_model_ = model
+        self._rf_X = X
+        self._rf_y = y
 
-        model.fit(X, y)
         return model.feature_importances_
 
-    def _correlation_scores(self, X: np.ndarray, y: pd.Series) -> np.ndarray:
+    def get_oob_feature_importance(self, n_repeats: int = 5) -> Dict[str, float]:
+        """
+        Permutation importance from the forest cached during fit
+
+        Reuses the warm-started RandomForest (fitted with oob_score=True)
+        instead of training a second model. Returns a feature -> mean
+        importance dict; features skipped as near-constant score 0.
+        """
+        if getattr(self, 'rf_model_', None) is None:
+            raise ValueError("No cached forest. Call fit() with the 'rf' backend first.")
+
+        result = permutation_importance(
+            self.rf_model_, self._rf_X, self._rf_y,
+            n_repeats=n_repeats,
+            random_state=self.config.rf_random_state,
+            n_jobs=-1
+        )
+        keep = self._score_keep_mask
+        full = np.zeros(len(self.feature_names))
+        full[keep] = result.importances_mean
+        return dict(zip(self.feature_names, full))
+
+    def _correlation_scores(self, X: np.ndarray, y: np.ndarray) -> np.ndarray:
         """Compute absolute correlation with target"""
-        scores = []
-        for i in range(X.shape[1]):
-            # Use Spearman for robustness
-            corr, _ = spearmanr(X[:, i], y)
-            scores.append(abs(corr))
-        return np.array(scores)
-
-    def _statistical_scores(self, X: np.ndarray, y: pd.Series) -> np.ndarray:
+        # Use Spearman for robustness: rank everything once, then
+        # correlate all columns against the target in one vectorized pass
+        # instead of a scipy call per column
+        n, p = X.shape
+        ry = rankdata(y)
+
+        # Small/medium tie-free matrices take the fused numba kernel,
+        # which skips the double-argsort temporaries entirely
+        if (spearman_cols is not None
+                and n * p <= _SPEARMAN_NUMBA_MAX_ELEMS
+                and np.unique(ry).size == n):
+            scores, exact = spearman_cols(
+                np.ascontiguousarray(X, dtype=np.float64), ry
+            )
+            if exact.all():
+                return scores
+            # Columns with ties need the exact rank path below
+
+        # Ranks fit comfortably in float32; halving the dot-product
+        # bandwidth costs nothing at the precision we report
+        rx = rankdata(X, axis=0).astype(np.float32)
+
+        rx_c = rx - rx.mean(axis=0)
+        ry_c = (ry - ry.mean()).astype(np.float32)
+        denom = np.sqrt((rx_c ** 2).sum(axis=0)) * np.sqrt((ry_c ** 2).sum())
+
+        # Zero-variance columns (or constant target) get score 0
+        scores = np.zeros(X.shape[1])
+        valid = denom > 0
+        if valid.any():
+            numer = rx_c.T @ ry_c
+            scores[valid] = np.abs(numer[valid] / denom[valid])
+        return scores
+
+    def _statistical_scores(self, X: np.ndarray, y: np.ndarray) -> np.ndarray:
         """Compute statistical test scores (ANOVA F-test)"""
         if self.config.task == 'classification':
-            scores, _ = f_classif(X, y)
-        else:
-            scores, _ = f_regression(X, y)
+            # One-way ANOVA across all columns at once: group sums come
+            # from a single matmul against the one-hot class matrix, so
+            # there is no per-feature Python loop
+            classes, y_codes = np.unique(y, return_inverse=True)
+            k = len(classes)
+            n = X.shape[0]
+            if k < 2 or n <= k:
+                scores, _ = f_classif(X, y)
+                return np.nan_to_num(scores, nan=0.0)
+
+            onehot = np.zeros((n, k), dtype=X.dtype)
+            onehot[np.arange(n), y_codes] = 1
+            counts = onehot.sum(axis=0)
+
+            group_means = (onehot.T @ X) / counts[:, None]
+            grand_mean = X.mean(axis=0)
+            ss_between = (
+                (group_means - grand_mean) ** 2 * counts[:, None]
+            ).sum(axis=0)
+            ss_total = ((X - grand_mean) ** 2).sum(axis=0)
+            ss_within = ss_total - ss_between
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                scores = (ss_between / (k - 1)) / (ss_within / (n - k))
+            return np.where(ss_within > 0, scores, 0.0)
+
+        scores, _ = f_regression(X, y)
 
         # Replace NaN with 0
         scores = np.nan_to_num(scores, nan=0.0)
         return scores
 
-    def _select_features(self, feature_names: List[str]):
-        """Select features based on criteria with redundancy removal"""
-        print(f"\n{'='*60}")
-        print("FEATURE SELECTION CRITERIA")
-        print('='*60)
+    def _greedy_select(
+        self,
+        candidates: np.ndarray,
+        corr_sub: Optional[np.ndarray],
+        feature_names: List[str]
+    ) -> Tuple[List[str], List[str], Dict[str, Tuple[float, str]]]:
+        """
+        Greedy ranked walk over the candidate pool with redundancy removal
 
-        # Aggregate scores (average across methods)
-        aggregated_scores = {}
-        for feature in feature_names:
-            scores = []
-            for method in self.feature_scores:
-                if feature in self.feature_scores[method]:
-                    scores.append(self.feature_scores[method][feature])
-
-            if scores:
-                # Normalize scores per method, then average
-                aggregated_scores[feature] = np.mean(scores)
-
-        # Sort by aggregated score
-        sorted_features = sorted(
-            aggregated_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        Works in pool-local indices: corr_sub is the candidate-submatrix
+        of |correlations| (None disables redundancy removal entirely).
+        The score threshold is applied by the caller as a prefix cut on
+        candidates. Returns (selected, removed, redundancy_details).
+        """
+        top_k = self.config.top_k
+        thr = self.config.max_correlation
+        selected, removed, details = [], [], {}
+
+        if corr_sub is not None and greedy_redundancy is not None:
+            k = -1 if top_k is None else top_k
+            picked, partner = greedy_redundancy(
+                corr_sub, np.arange(len(candidates), dtype=np.int64), thr, k
+            )
+            for pos in range(len(candidates)):
+                name = feature_names[candidates[pos]]
+                if picked[pos]:
+                    selected.append(name)
+                elif partner[pos] >= 0:
+                    removed.append(name)
+                    details[name] = (
+                        float(corr_sub[pos, partner[pos]]),
+                        feature_names[candidates[partner[pos]]]
+                    )
+            return selected, removed, details
+
+        selected_local = []
+        for pos, j in enumerate(candidates):
+            if top_k is not None and len(selected) >= top_k:
+                break
 
-        # Determine target count based on criteria
-        if self.config.top_k is not None:
-            target_k = self.config.top_k
-            print(f"Criterion: Top {self.config.top_k} features (with redundancy removal)")
-        elif self.config.threshold is not None:
-            target_k = len([f for f in sorted_features if f[1] >= self.config.threshold])
-            print(f"Criterion: Score >= {self.config.threshold} (with redundancy removal)")
-        else:
-            target_k = len(sorted_features)
-            print(f"Criterion: All features (ranked, with redundancy removal)")
+            if selected_local and corr_sub is not None:
+                corrs = corr_sub[pos, selected_local]
+                worst = int(corrs.argmax())
+                if corrs[worst] > thr:
+                    name = feature_names[j]
+                    removed.append(name)
+                    details[name] = (float(corrs[worst]), selected[worst])
+                    continue
 
-        # Select features while removing redundancy
-        self.selected_features = []
-        self.removed_redundant = []
-        redundancy_details = {}  # feature -> (corr, correlated_with)
+            selected.append(feature_names[j])
+            selected_local.append(pos)
 
-        for feature, score in sorted_features:
-            # Stop if we have enough features
-            if self.config.top_k is not None and len(self.selected_features) >= self.config.top_k:
-                break
+        return selected, removed, details
 
-            # Check threshold
-            if self.config.threshold is not None and score < self.config.threshold:
-                break
+    def _select_features(self, feature_names: List[str]):
+        """Select features based on criteria with redundancy removal"""
+        self._log(f"\n{'='*60}")
+        self._log("FEATURE SELECTION CRITERIA")
+        self._log('='*60)
+
+        # Aggregate scores: stack the normalized arrays cached at fit time
+        # into one (M, P) matrix and average in single numpy passes; the
+        # min-max scaling keeps unbounded scores (MI) from dominating
+        # bounded ones (Spearman)
+        methods = list(self._normalized_scores)
+        if not methods:
+            # Every scorer failed or was unknown: there is no ranking to
+            # walk, so select nothing instead of handing back the first
+            # top_k columns in input order
+            logger.warning("No feature scores computed; selecting no features")
+            self.selected_features = []
+            self.removed_redundant = []
+            return
 
-            # Check correlation with already selected features
-            if self.selected_features and self.config.max_correlation < 1.0:
-                feature_idx = self.feature_names.index(feature)
-                is_redundant = False
+        score_mat = np.vstack([self._normalized_scores[m] for m in methods])
+        agg = np.nanmean(score_mat, axis=0)
+        agg = np.where(np.isnan(agg), 0.0, agg)
 
-                for selected_feature in self.selected_features:
-                    selected_idx = self.feature_names.index(selected_feature)
+        order = np.argsort(-agg, kind='stable')
 
-                    # Calculate correlation
-                    corr = np.corrcoef(
-                        self.X_numeric[:, feature_idx],
-                        self.X_numeric[:, selected_idx]
-                    )[0, 1]
+        # Log the selection criterion; the greedy walk below reads
+        # top_k/threshold straight from the config
+        if self.config.top_k is not None:
+            self._log(f"Criterion: Top {self.config.top_k} features (with redundancy removal)")
+        elif self.config.threshold is not None:
+            self._log(f"Criterion: Score >= {self.config.threshold} (with redundancy removal)")
+        else:
+            self._log("Criterion: All features (ranked, with redundancy removal)")
+
+        # Standardize once; the |correlation| matmul itself runs on a
+        # candidate pool, not all P columns. Skipped entirely when the
+        # threshold disables removal (>= 1.0) or there is at most one
+        # feature, which cannot be redundant with anything
+        need_corr = (
+            self.config.max_correlation < 1.0
+            and self.X_numeric is not None
+            and len(feature_names) > 1
+        )
+        Xz = None
+        if need_corr:
+            X = self.X_numeric
+            std = X.std(axis=0, ddof=0)
+            std = np.where(std == 0, 1.0, std)
+            # Keep the standardized matrix in float32 so the matmul stays
+            # memory-bound on half the bytes
+            Xz = ((X - X.mean(axis=0)) / std).astype(np.float32, copy=False)
+
+        # In top-k mode a generous prefix of the ranking is almost always
+        # enough — only those columns get the correlation matmul. If
+        # redundancy thins the pool below top_k, widen to the full set
+        # and rerun once.
+        p = len(feature_names)
+        if need_corr and self.config.top_k is not None:
+            pool_size = min(p, max(self.config.top_k * 3, 200))
+        else:
+            pool_size = p
+
+        while True:
+            candidates = order[:pool_size]
+            if self.config.threshold is not None:
+                n_above = int((agg[candidates] >= self.config.threshold).sum())
+                candidates = candidates[:n_above]
+
+            corr_sub = None
+            if need_corr:
+                Xc = np.ascontiguousarray(Xz[:, candidates])
+                if self.config.use_gpu and _cupy is not None:
+                    # Same GEMM on the device; only the p x p result
+                    # travels back over the bus
+                    Zc = _cupy.asarray(Xc)
+                    corr_sub = _cupy.asnumpy(_cupy.abs(Zc.T @ Zc)) / Xz.shape[0]
+                else:
+                    corr_sub = np.abs(Xc.T @ Xc) / Xz.shape[0]
 
-                    if abs(corr) > self.config.max_correlation:
-                        is_redundant = True
-                        self.removed_redundant.append(feature)
-                        redundancy_details[feature] = (abs(corr), selected_feature)
-                        break
+            selected, removed, redundancy_details = self._greedy_select(
+                candidates, corr_sub, feature_names
+            )
 
-                if is_redundant:
-                    continue
+            pool_exhausted = (
+                pool_size < p
+                and self.config.top_k is not None
+                and len(selected) < self.config.top_k
+                and len(candidates) == pool_size
+            )
+            if pool_exhausted:
+                pool_size = p
+                continue
+            break
 
-            # Add feature to selected
-            self.selected_features.append(feature)
+        self.selected_features = selected
+        self.removed_redundant = removed
 
-        print(f"Selected: {len(self.selected_features)} / {len(feature_names)} features")
+        self._log(f"Selected: {len(self.selected_features)} / {len(feature_names)} features")
         if self.removed_redundant:
-            print(f"Removed as redundant: {len(self.removed_redundant)} features")
-
-        # Create summary
-        self.feature_summary = pd.DataFrame([
-            {
-                'feature': feature,
-                'aggregated_score': aggregated_scores.get(feature, 0),
-                'selected': feature in self.selected_features,
-                'redundant': feature in self.removed_redundant,
-                'correlated_with': redundancy_details.get(feature, (None, None))[1] if feature in redundancy_details else None,
-                'correlation': redundancy_details.get(feature, (None, None))[0] if feature in redundancy_details else None,
-                **{f'{method}_score': self.feature_scores[method].get(feature, 0)
-                   for method in self.feature_scores}
-            }
-            for feature in feature_names
-        ]).sort_values('aggregated_score', ascending=False)
+            self._log(f"Removed as redundant: {len(self.removed_redundant)} features")
+
+        # Create summary from column arrays in one DataFrame constructor
+        # call instead of a dict per feature
+        p = len(feature_names)
+        selected_set = set(self.selected_features)
+        redundant_set = set(self.removed_redundant)
+
+        data = {
+            'feature': feature_names,
+            'aggregated_score': agg,
+            'selected': np.fromiter(
+                (f in selected_set for f in feature_names), dtype=bool, count=p
+            ),
+            'redundant': np.fromiter(
+                (f in redundant_set for f in feature_names), dtype=bool, count=p
+            ),
+            'correlated_with': [
+                redundancy_details[f][1] if f in redundancy_details else None
+                for f in feature_names
+            ],
+            'correlation': [
+                redundancy_details[f][0] if f in redundancy_details else None
+                for f in feature_names
+            ]
+        }
+        for method in self.feature_scores:
+            method_scores = self.feature_scores[method]
+            data[f'{method}_score'] = np.fromiter(
+                (method_scores.get(f, 0) for f in feature_names),
+                dtype=np.float64, count=p
+            )
+
+        self.feature_summary = pd.DataFrame(data).sort_values(
+            'aggregated_score', ascending=False
+        )
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """Select only the chosen features"""
         if not self.selected_features:
             raise ValueError("No features selected. Call fit() first.")
 
-        # Select features that exist in X
-        available_features = [f for f in self.selected_features if f in X.columns]
+        # Hash-based membership check via pandas Index instead of a
+        # Python scan of X.columns per selected feature; copy-on-write
+        # keeps the column selection itself lazy
+        selected = pd.Index(self.selected_features)
+        available = selected.isin(X.columns)
 
-        if len(available_features) < len(self.selected_features):
-            missing = set(self.selected_features) - set(available_features)
-            print(f"Warning: {len(missing)} selected features not found in data: {missing}")
+        if not available.all():
+            missing = set(selected[~available])
+            logger.warning(f"{len(missing)} selected features not found in data: {missing}")
+            selected = selected[available]
 
-        return X[available_features]
+        return X[selected]
 
     def fit_transform(
         self,
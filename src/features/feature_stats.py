@@ -0,0 +1,46 @@
+"""
+Shared Feature Statistics
+Computes per-column statistics once so pipeline stages can reuse them
+"""
+import pandas as pd
+from typing import List, Optional
+from dataclasses import dataclass
+
+
+@dataclass
+class FeatureStats:
+    """
+    Per-column statistics computed once and shared across pipeline stages
+
+    FeatureEngineer (binary detection) and FeatureFilter (quality checks)
+    both need cardinality, missingness and variance. Computing them once
+    at pipeline start avoids repeated full-column scans.
+    """
+    nunique: pd.Series
+    missing_rate: pd.Series
+    variance: pd.Series
+    dtypes: pd.Series
+
+    @classmethod
+    def compute(
+        cls,
+        df: pd.DataFrame,
+        columns: Optional[List[str]] = None
+    ) -> 'FeatureStats':
+        """
+        Compute statistics for the given columns (all columns if None)
+
+        Args:
+            df: Input dataframe
+            columns: Columns to analyze (defaults to all)
+
+        Returns:
+            FeatureStats with one entry per column
+        """
+        block = df[list(columns)] if columns is not None else df
+        return cls(
+            nunique=block.nunique(dropna=True),
+            missing_rate=block.isna().mean(),
+            variance=block.var(numeric_only=True),
+            dtypes=block.dtypes
+        )
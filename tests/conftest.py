@@ -0,0 +1,7 @@
+"""
+Shared pytest configuration: make the repo root importable once.
+"""
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
@@ -1,9 +1,7 @@
 """
 Test Auto-Save Functionality
 """
-import sys
 import os
-sys.path.append('/Users/chaimaesriti/piaa-codex/piaa')
 
 import numpy as np
 import pandas as pd
@@ -1,9 +1,6 @@
 """
 Test Binary Feature Detection and Target Exclusion
 """
-import sys
-sys.path.append('/Users/chaimaesriti/piaa-codex/piaa')
-
 import numpy as np
 import pandas as pd
 from src.features.feature_engineering import FeatureEngineer, FeatureTransformConfig
@@ -1,8 +1,7 @@
 """
 Test Feature Selection Module
 """
-import sys
-sys.path.append('/Users/chaimaesriti/piaa-codex/piaa')
+import functools
 
 import numpy as np
 import pandas as pd
@@ -11,6 +10,15 @@ from src.features.feature_selection import FeatureSelector, FeatureSelectionConf
 
 def create_classification_data(n_samples=500, n_features=20, n_informative=5):
     """Create synthetic classification dataset"""
+    # Hand out copies of the memoized dataset so tests can mutate freely
+    X_df, y_series, feature_names = _create_classification_data_cached(
+        n_samples, n_features, n_informative
+    )
+    return X_df.copy(), y_series.copy(), list(feature_names)
+
+
+@functools.lru_cache(maxsize=16)
+def _create_classification_data_cached(n_samples, n_features, n_informative):
     from sklearn.datasets import make_classification
 
     # Adjust redundant and repeated based on total features
@@ -142,8 +150,7 @@ def test_multi_method_selection():
     print(f"\n{'='*60}")
     print(f"Final selected features: {len(selected)}")
     print('='*60)
-    for i, feat in enumerate(selected, 1):
-        print(f"  {i}. {feat}")
+    print("\n".join(f"  {i}. {feat}" for i, feat in enumerate(selected, 1)))
 
     assert len(selected) == 8
     print("\n✓ Multi-method selection passed!")
@@ -201,15 +208,15 @@ def test_feature_scores():
     # Get aggregated scores
     agg_scores = fs.get_feature_scores()
     print(f"\nAggregated scores (top 5):")
-    for feat, score in list(agg_scores.items())[:5]:
-        print(f"  {feat}: {score:.4f}")
+    print("\n".join(
+        f"  {feat}: {score:.4f}" for feat, score in list(agg_scores.items())[:5]
+    ))
 
     # Get method-specific scores
     mi_scores = fs.get_feature_scores('mutual_info')
     print(f"\nMutual Information scores (top 5):")
     sorted_mi = sorted(mi_scores.items(), key=lambda x: x[1], reverse=True)
-    for feat, score in sorted_mi[:5]:
-        print(f"  {feat}: {score:.4f}")
+    print("\n".join(f"  {feat}: {score:.4f}" for feat, score in sorted_mi[:5]))
 
     # Get top features
     top_5 = fs.get_top_features(k=5)
@@ -277,8 +284,7 @@ def test_with_transformed_features():
     print(f"\n{'='*60}")
     print(f"Top 5 selected features for modeling:")
     print('='*60)
-    for i, feat in enumerate(selected, 1):
-        print(f"  {i}. {feat}")
+    print("\n".join(f"  {i}. {feat}" for i, feat in enumerate(selected, 1)))
 
     assert len(selected) == 5
     print("\n✓ Engineered features test passed!")
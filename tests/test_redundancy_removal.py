@@ -1,10 +1,6 @@
 """
 Test redundancy removal in feature selection
 """
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 import numpy as np
 import pandas as pd
 from src.features.feature_selection import FeatureSelector, FeatureSelectionConfig
@@ -17,22 +13,24 @@ def test_redundancy_removal():
     print("="*60)
 
     # Create sample data with correlated features
-    np.random.seed(42)
+    # PCG64 Generator: faster sampling than the legacy global RandomState
+    # and no shared global state
+    rng = np.random.default_rng(42)
     n_samples = 1000
 
     # Base feature
-    age = np.random.randint(18, 80, n_samples)
+    age = rng.integers(18, 80, n_samples)
 
     # Create correlated features (like age, age_capped, age_binned_10, age_binned_20)
     age_capped = np.clip(age, 20, 70)  # Very correlated with age
-    age_plus_noise = age + np.random.normal(0, 0.5, n_samples)  # Almost identical
+    age_plus_noise = age + rng.normal(0, 0.5, n_samples)  # Almost identical
 
     # Independent features
-    income = np.random.randint(20000, 150000, n_samples)
-    score = np.random.randint(300, 850, n_samples)
+    income = rng.integers(20000, 150000, n_samples)
+    score = rng.integers(300, 850, n_samples)
 
     # Target (correlated with age and income)
-    target = (age * 0.5 + income * 0.00001 + np.random.normal(0, 5, n_samples)) > 40
+    target = (age * 0.5 + income * 0.00001 + rng.normal(0, 5, n_samples)) > 40
     target = target.astype(int)
 
     # Create DataFrame
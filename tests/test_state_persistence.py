@@ -0,0 +1,100 @@
+"""
+Test Fitted-State Persistence (save_state / load_state)
+"""
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from src.features.feature_engineering import FeatureEngineer
+
+
+def create_sample_data(n_samples=500):
+    """Create sample dataset for testing"""
+    np.random.seed(42)
+    return pd.DataFrame({
+        'age': np.random.randint(18, 80, n_samples),
+        'income': np.random.exponential(50000, n_samples),
+        'is_premium': np.random.choice([0, 1], n_samples),
+        'country': np.random.choice(
+            ['USA', 'UK', 'Canada', 'Germany', 'France', 'Belgium', 'Switzerland'],
+            n_samples,
+            p=[0.4, 0.25, 0.15, 0.1, 0.08, 0.015, 0.005]
+        ),
+    })
+
+
+def test_save_and_load_state():
+    """Test that a reloaded engineer reproduces the fitted transforms"""
+    print("=" * 60)
+    print("Testing State Persistence")
+    print("=" * 60)
+
+    df = create_sample_data()
+    numerical_cols = ['age', 'income', 'is_premium']
+    categorical_cols = ['country']
+
+    fe = FeatureEngineer()
+    df_fit = fe.fit_transform_numerical(df, numerical_cols)
+    df_fit = fe.fit_transform_categorical(df_fit, categorical_cols)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_path = os.path.join(tmpdir, 'fe_state')
+        fe.save_state(state_path)
+
+        assert os.path.exists(f"{state_path}.npz"), "npz state file should exist"
+        assert os.path.exists(f"{state_path}.json"), "json sidecar should exist"
+
+        # Fresh engineer restored from disk
+        fe_loaded = FeatureEngineer().load_state(state_path)
+
+    assert fe_loaded.feature_mapping == fe.feature_mapping, \
+        "Feature mapping should survive the round trip"
+    assert fe_loaded.binary_features == fe.binary_features, \
+        "Binary features should survive the round trip"
+    assert fe_loaded.get_feature_list() == fe.get_feature_list(), \
+        "Feature list should survive the round trip"
+
+    # Replaying the transforms must give identical output
+    df_new = create_sample_data(200)
+    out_orig = fe.transform_numerical(df_new, ['age', 'income'])
+    out_orig = fe.transform_categorical(out_orig, categorical_cols)
+    out_loaded = fe_loaded.transform_numerical(df_new, ['age', 'income'])
+    out_loaded = fe_loaded.transform_categorical(out_loaded, categorical_cols)
+
+    pd.testing.assert_frame_equal(out_orig, out_loaded)
+
+    print("\n✓ State persistence test passed!")
+
+
+def test_load_rejects_unknown_version():
+    """Test that load_state rejects state with a different version tag"""
+    import json
+
+    fe = FeatureEngineer()
+    df = create_sample_data(100)
+    fe.fit_transform_numerical(df, ['age'])
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        state_path = os.path.join(tmpdir, 'fe_state')
+        fe.save_state(state_path)
+
+        # Tamper with the version tag
+        with open(f"{state_path}.json") as f:
+            sidecar = json.load(f)
+        sidecar['version'] = -1
+        with open(f"{state_path}.json", 'w') as f:
+            json.dump(sidecar, f)
+
+        try:
+            FeatureEngineer().load_state(state_path)
+            assert False, "load_state should reject unknown versions"
+        except ValueError:
+            pass
+
+    print("✓ Version check test passed!")
+
+
+if __name__ == "__main__":
+    test_save_and_load_state()
+    test_load_rejects_unknown_version()
@@ -6,16 +6,65 @@ Usage: python transform_data.py train.csv [options]
 import sys
 import os
 import argparse
+import hashlib
+import numpy as np
 import pandas as pd
 from src.features.feature_engineering import FeatureEngineer, FeatureTransformConfig
 from src.features.feature_filter import FeatureFilter, FeatureFilterConfig
 from src.features.feature_selection import FeatureSelector, FeatureSelectionConfig
 
+# Copy-on-Write lets frames share untouched column arrays (default from
+# pandas 3.0 onward); opt in explicitly on pandas 2.x
+if tuple(int(p) for p in pd.__version__.split('.')[:1]) == (2,):
+    pd.options.mode.copy_on_write = True
+
+
+def load_input_data(input_file):
+    """
+    Load a CSV or Parquet file into a DataFrame
+
+    Picks the reader by extension; for CSV it tries the multithreaded
+    pyarrow parser first and falls back to pandas' default C engine
+    when pyarrow is not installed.
+    """
+    if input_file.endswith('.parquet'):
+        return pd.read_parquet(input_file)
+    try:
+        return pd.read_csv(input_file, engine='pyarrow')
+    except (ImportError, ValueError):
+        return pd.read_csv(input_file)
+
+
+def save_output_data(df, output_file, file_format='csv'):
+    """
+    Write the transformed frame to CSV or Parquet
+
+    CSV writes go through pyarrow's chunked multithreaded writer when
+    pyarrow is installed, falling back to DataFrame.to_csv otherwise.
+    """
+    if file_format == 'parquet':
+        df.to_parquet(output_file, index=False)
+        return
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), output_file)
+    except ImportError:
+        df.to_csv(output_file, index=False)
+
 
 def infer_column_types(df):
     """Automatically infer numerical and categorical columns"""
-    numerical = df.select_dtypes(include=['int64', 'float64']).columns.tolist()
-    categorical = df.select_dtypes(include=['object', 'category']).columns.tolist()
+    # Classify from df.dtypes in one pass instead of two select_dtypes
+    # scans over the block manager (matters on very wide frames)
+    numerical = []
+    categorical = []
+    for col, dtype in df.dtypes.items():
+        if (isinstance(dtype, pd.CategoricalDtype) or dtype == object
+                or pd.api.types.is_string_dtype(dtype)):
+            categorical.append(col)
+        elif pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            numerical.append(col)
     return numerical, categorical
 
 
@@ -48,6 +97,8 @@ def main():
     parser.add_argument('--output', '-o', help='Output file path (default: auto-generated as transformed_{input_name}.csv)')
     parser.add_argument('--no-save', action='store_true',
                         help='Do not automatically save transformed data')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv',
+                        help='Output file format (default: csv; parquet needs pyarrow)')
     parser.add_argument('--cap-percentiles', nargs=2, type=float, default=[1, 99],
                         help='Percentiles for capping (default: 1 99)')
     parser.add_argument('--bins', nargs='+', type=int, default=[10, 20],
@@ -56,6 +107,8 @@ def main():
                         help='Minimum category frequency (default: 0.01)')
     parser.add_argument('--show-summary', action='store_true',
                         help='Show transformation summary')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse fitted transform parameters across runs (stored in .piaa_cache/)')
 
     # Feature filtering options
     parser.add_argument('--filter', action='store_true',
@@ -86,7 +139,7 @@ def main():
     # Load data
     print(f"Loading data from {args.input_file}...")
     try:
-        df = pd.read_csv(args.input_file)
+        df = load_input_data(args.input_file)
         print(f"✓ Loaded {len(df)} rows, {len(df.columns)} columns")
     except Exception as e:
         print(f"✗ Error loading file: {e}")
@@ -94,7 +147,13 @@ def main():
 
     print(f"\nColumns: {', '.join(df.columns.tolist())}")
     print(f"\nData types:")
-    print(df.dtypes)
+    # Formatting one dtype line per column stalls on very wide frames;
+    # truncate the listing past 20 columns
+    if len(df.columns) <= 20:
+        print(df.dtypes)
+    else:
+        print(df.dtypes.head(20))
+        print(f"... ({len(df.columns)} columns total)")
 
     # Determine column types
     if args.numerical or args.categorical:
@@ -108,6 +167,22 @@ def main():
     print(f"  Numerical ({len(numerical_cols)}): {numerical_cols}")
     print(f"  Categorical ({len(categorical_cols)}): {categorical_cols}")
 
+    # Downcast numerics before transforming: the engineering, filtering
+    # and selection steps are memory-bound, and float32/narrow ints move
+    # half the bytes of the default 64-bit dtypes
+    for col in numerical_cols:
+        if col in df.columns:
+            if pd.api.types.is_float_dtype(df[col]):
+                df[col] = df[col].astype(np.float32)
+            elif pd.api.types.is_integer_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+
+    # Categorical columns move to category dtype once, so the grouping
+    # passes work on integer codes instead of re-factorizing strings
+    for col in categorical_cols:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+
     # Create config
     config = FeatureTransformConfig(
         cap_percentiles=tuple(args.cap_percentiles),
@@ -118,25 +193,58 @@ def main():
     # Initialize feature engineer
     fe = FeatureEngineer(config)
 
+    # Fitted-state cache: re-running over an unchanged input and config
+    # replays the stored cap bounds, bin edges and category mappings
+    # instead of recomputing them
+    cache_base = None
+    fitted_from_cache = False
+    if args.cache:
+        cache_key = hashlib.sha1(
+            f"{os.path.abspath(args.input_file)}:{os.path.getmtime(args.input_file)}:"
+            f"{args.cap_percentiles}:{args.bins}:{args.min_freq}:{args.target}".encode()
+        ).hexdigest()
+        cache_base = os.path.join('.piaa_cache', cache_key)
+        if os.path.exists(f"{cache_base}.json") and os.path.exists(f"{cache_base}.npz"):
+            fe.load_state(cache_base)
+            fitted_from_cache = True
+            print(f"\n✓ Reusing fitted transform state from {cache_base}")
+
     # Transform features
     print(f"\n{'='*60}")
     print("TRANSFORMING FEATURES")
     print('='*60)
 
-    df_transformed = df.copy()
+    # No upfront copy: every fit_transform_* below returns a new frame
+    # via df.assign, and Copy-on-Write keeps untouched columns shared,
+    # so peak memory stays at one copy of the input
+    df_transformed = df
 
     # Numerical transformations
     if numerical_cols:
         print(f"\nTransforming {len(numerical_cols)} numerical features...")
-        df_transformed = fe.fit_transform_numerical(df_transformed, numerical_cols, target_col=args.target)
+        if fitted_from_cache:
+            fitted = [c for c in numerical_cols if c in fe.feature_mapping]
+            df_transformed = fe.transform_numerical(df_transformed, fitted)
+        else:
+            df_transformed = fe.fit_transform_numerical(df_transformed, numerical_cols, target_col=args.target)
         print(f"✓ Created numerical transformations")
 
     # Categorical transformations
     if categorical_cols:
         print(f"\nTransforming {len(categorical_cols)} categorical features...")
-        df_transformed = fe.fit_transform_categorical(df_transformed, categorical_cols, target_col=args.target)
+        if fitted_from_cache:
+            fitted = [c for c in categorical_cols if c in fe.feature_mapping]
+            df_transformed = fe.transform_categorical(df_transformed, fitted)
+        else:
+            df_transformed = fe.fit_transform_categorical(df_transformed, categorical_cols, target_col=args.target)
         print(f"✓ Processed categorical features")
 
+    # Persist the freshly fitted state for the next run
+    if cache_base is not None and not fitted_from_cache:
+        os.makedirs('.piaa_cache', exist_ok=True)
+        fe.save_state(cache_base)
+        print(f"✓ Cached fitted transform state at {cache_base}")
+
     # Feature filtering (optional)
     if args.filter:
         print(f"\n{'='*60}")
@@ -254,13 +362,15 @@ def main():
             output_file = args.output
         else:
             output_file = generate_output_filename(args.input_file)
+            if args.format == 'parquet':
+                output_file = os.path.splitext(output_file)[0] + '.parquet'
 
         print(f"SAVING TRANSFORMED DATA")
         print('='*60)
         print(f"Output file: {output_file}")
 
         try:
-            df_transformed.to_csv(output_file, index=False)
+            save_output_data(df_transformed, output_file, args.format)
             print(f"✓ Saved {len(df_transformed)} rows, {len(df_transformed.columns)} columns")
             print(f"✓ File: {output_file}")
         except Exception as e: